@@ -4,12 +4,42 @@ Modules:
 - game: Board and game orchestration atop python-chess
 - evaluator: Heuristic evaluation function for positions
 - ai: Minimax with alpha-beta pruning and simple transposition table
+- tables: Shared read-only engine data (merged PSTs, Zobrist keys, openings)
+
+Public names are imported lazily on first attribute access so that importing a
+single submodule does not pull in the whole engine.
 """
 
-from .game import Game
-from .ai import AIPlayer
-from .evaluator import Evaluator
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .game import Game
+    from .ai import AIPlayer
+    from .evaluator import Evaluator
+    from .tables import EngineTables, load_tables
+
+__all__ = ["Game", "AIPlayer", "Evaluator", "EngineTables", "load_tables"]
+
+_LAZY_ATTRS = {
+    "Game": ".game",
+    "AIPlayer": ".ai",
+    "Evaluator": ".evaluator",
+    "EngineTables": ".tables",
+    "load_tables": ".tables",
+}
+
 
-__all__ = ["Game", "AIPlayer", "Evaluator"]
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
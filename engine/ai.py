@@ -9,6 +9,7 @@ import chess
 import chess.polyglot  # ensure polyglot is loaded for zobrist hashing
 
 from .evaluator import Evaluator
+from .tables import load_tables
 
 
 @dataclass
@@ -19,6 +20,14 @@ class SearchResult:
     scored_moves: Optional[List[Tuple[chess.Move, int]]] = None
 
 
+@dataclass
+class MoveChoice:
+    move: Optional[str]
+    # Deepest fully-searched iteration; 0 for timeout fallbacks, None for book picks
+    depth: Optional[int]
+    book: bool = False
+
+
 class AIPlayer:
     """Minimax with Alpha-Beta pruning, transposition table, and time-limited search."""
 
@@ -28,13 +37,14 @@ class AIPlayer:
         self._deadline_ts: Optional[float] = None
         self.variety_mode = variety_mode
 
+        # Shared read-only tables (opening lists, Zobrist keys); built once per
+        # process and inherited by preloaded workers
+        tables = load_tables()
+        self._zobrist_hasher = tables.zobrist_hasher
+
         # Lightweight opening variety lists (filtered against legality at runtime)
-        self._opening_first_moves_white: List[str] = [
-            "e2e4", "d2d4", "c2c4", "g1f3", "b1c3", "g2g3", "b2b3", "f2f4", "e2e3", "d2d3",
-        ]
-        self._opening_first_moves_black: List[str] = [
-            "e7e5", "c7c5", "e7e6", "c7c6", "g8f6", "d7d6", "g7g6", "b8c6", "d7d5",
-        ]
+        self._opening_first_moves_white: Tuple[str, ...] = tables.opening_first_moves_white
+        self._opening_first_moves_black: Tuple[str, ...] = tables.opening_first_moves_black
 
     def choose_move(self, board: chess.Board, depth: int, time_limit_s: Optional[float] = None) -> Optional[str]:
         """Choose a move using iterative deepening up to depth or time limit.
@@ -42,19 +52,24 @@ class AIPlayer:
         If time_limit_s is provided, the search will progressively deepen and
         return the best fully-computed result when time expires.
         """
+        return self.search(board, depth, time_limit_s).move
+
+    def search(self, board: chess.Board, depth: int, time_limit_s: Optional[float] = None) -> MoveChoice:
+        """Like choose_move, but also report how deep the search got."""
         # Opening variety: first move for White, or first reply for Black
         if self.variety_mode:
             if len(board.move_stack) == 0 and board.turn == chess.WHITE:
                 candidates = [uci for uci in self._opening_first_moves_white if chess.Move.from_uci(uci) in board.legal_moves]
                 if candidates:
-                    return random.choice(candidates)
+                    return MoveChoice(move=random.choice(candidates), depth=None, book=True)
             if len(board.move_stack) == 1 and board.turn == chess.BLACK and board.fullmove_number == 1:
                 candidates = [uci for uci in self._opening_first_moves_black if chess.Move.from_uci(uci) in board.legal_moves]
                 if candidates:
-                    return random.choice(candidates)
+                    return MoveChoice(move=random.choice(candidates), depth=None, book=True)
         best_move_overall: Optional[chess.Move] = None
         best_score_overall: int = -10**9
         nodes_total = 0
+        depth_reached = 0
 
         self._deadline_ts = (time.time() + time_limit_s) if time_limit_s else None
 
@@ -74,13 +89,14 @@ class AIPlayer:
                     best_score_overall = result.score
                 if result.scored_moves is not None:
                     last_depth_scored_moves = result.scored_moves
+                depth_reached = d
             except _SearchTimeout:
                 break
 
         # Clear deadline after search
         self._deadline_ts = None
         if best_move_overall is None:
-            return fallback_move.uci() if fallback_move else None
+            return MoveChoice(move=fallback_move.uci() if fallback_move else None, depth=0)
 
         # Diversify: among near-best root moves pick randomly
         if last_depth_scored_moves:
@@ -103,9 +119,9 @@ class AIPlayer:
                 if len(within_tol) > 12:
                     within_tol = within_tol[:12]
             if within_tol:
-                return random.choice(within_tol).uci()
+                return MoveChoice(move=random.choice(within_tol).uci(), depth=depth_reached)
 
-        return best_move_overall.uci()
+        return MoveChoice(move=best_move_overall.uci(), depth=depth_reached)
 
     def _alphabeta_root(self, board: chess.Board, depth: int) -> SearchResult:
         best_score = -10**9
@@ -148,7 +164,7 @@ class AIPlayer:
         maximizing: bool,
     ) -> Tuple[int, int]:
         # Transposition probe
-        key = (chess.polyglot.zobrist_hash(board), depth, maximizing)
+        key = (self._zobrist_hasher(board), depth, maximizing)
         if key in self.transposition_table:
             score, _ = self.transposition_table[key]
             return score, 0
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 import chess
 
@@ -89,6 +89,10 @@ class Evaluator:
         20, 30, 10, 0, 0, 10, 30, 20,
     ]
 
+    # Merged material + PST view and its block layout from engine.tables,
+    # bound on first use
+    _PIECE_SQUARE: Optional[Tuple[memoryview, Tuple[Tuple[chess.Color, chess.PieceType, int], ...]]] = None
+
     @classmethod
     def evaluate(cls, board: chess.Board) -> int:
         if board.is_checkmate():
@@ -98,22 +102,12 @@ class Evaluator:
 
         score = 0
 
-        # Material + piece-square
-        for piece_type in [
-            chess.PAWN,
-            chess.KNIGHT,
-            chess.BISHOP,
-            chess.ROOK,
-            chess.QUEEN,
-            chess.KING,
-        ]:
-            for square in board.pieces(piece_type, chess.WHITE):
-                score += cls.MATERIAL_VALUES[piece_type]
-                score += cls._pst_for(piece_type)[square]
-            for square in board.pieces(piece_type, chess.BLACK):
-                score -= cls.MATERIAL_VALUES[piece_type]
-                # Mirror square for black to re-use same PST
-                score -= cls._pst_for(piece_type)[chess.square_mirror(square)]
+        # Material + piece-square, merged and pre-mirrored for Black in the
+        # shared engine tables
+        table, blocks = cls._piece_square_table()
+        for color, piece_type, offset in blocks:
+            for square in board.pieces(piece_type, color):
+                score += table[offset + square]
 
         # Mobility small bonus
         score += 2 * board.legal_moves.count()
@@ -123,6 +117,16 @@ class Evaluator:
 
         return score
 
+    @classmethod
+    def _piece_square_table(cls):
+        bound = cls._PIECE_SQUARE
+        if bound is None:
+            # Imported lazily: the tables module builds from this class
+            from .tables import PIECE_SQUARE_BLOCKS, load_tables
+
+            bound = cls._PIECE_SQUARE = (load_tables().piece_square, PIECE_SQUARE_BLOCKS)
+        return bound
+
     @classmethod
     def _pst_for(cls, piece_type: chess.PieceType):
         if piece_type == chess.PAWN:
@@ -0,0 +1,98 @@
+"""Read-only engine data built once per process and shared by all searches.
+
+Bulk table data is stored in flat ``array`` buffers exposed as read-only
+``memoryview``s so that, when the web app is preloaded in the gunicorn master,
+forked workers can share the pages copy-on-write. A list or tuple of Python
+objects would be touched by reference counting on every lookup and slowly
+duplicated into each worker; a flat buffer is never written to. The opening
+lists are plain tuples of ``str`` and do get un-shared, which is fine at their
+size.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+import time
+
+import chess
+import chess.polyglot
+
+from .evaluator import Evaluator
+
+
+_PIECE_TYPES = (
+    chess.PAWN,
+    chess.KNIGHT,
+    chess.BISHOP,
+    chess.ROOK,
+    chess.QUEEN,
+    chess.KING,
+)
+
+
+@dataclass(frozen=True)
+class EngineTables:
+    # Material + piece-square score from White's point of view, indexed by
+    # piece_square_offset(piece_type, color) + square. Black entries are
+    # already mirrored and negated. Read-only view over an ``array("i")``.
+    piece_square: memoryview
+    # Backed by the polyglot list of Python ints: reading from an ``array("Q")``
+    # allocates a new int per lookup, which costs more on the search hot path
+    # than the 6 KiB of un-shared keys
+    zobrist_hasher: chess.polyglot.ZobristHasher
+    opening_first_moves_white: Tuple[str, ...]
+    opening_first_moves_black: Tuple[str, ...]
+    build_seconds: float
+
+
+def piece_square_offset(piece_type: chess.PieceType, color: chess.Color) -> int:
+    """Start index of a (piece, color) block inside ``EngineTables.piece_square``."""
+    return ((0 if color == chess.WHITE else 6) + piece_type - 1) * 64
+
+
+# (color, piece_type, offset) for every block of ``EngineTables.piece_square``
+PIECE_SQUARE_BLOCKS: Tuple[Tuple[chess.Color, chess.PieceType, int], ...] = tuple(
+    (color, piece_type, piece_square_offset(piece_type, color))
+    for color in (chess.WHITE, chess.BLACK)
+    for piece_type in _PIECE_TYPES
+)
+
+
+def _build_piece_square() -> array:
+    values = array("i", [0] * (2 * 6 * 64))
+    for piece_type in _PIECE_TYPES:
+        material = Evaluator.MATERIAL_VALUES[piece_type]
+        pst = Evaluator._pst_for(piece_type)
+        white = piece_square_offset(piece_type, chess.WHITE)
+        black = piece_square_offset(piece_type, chess.BLACK)
+        for square in chess.SQUARES:
+            values[white + square] = material + pst[square]
+            # Mirror square for black to re-use same PST
+            values[black + square] = -(material + pst[chess.square_mirror(square)])
+    return values
+
+
+@lru_cache(maxsize=None)
+def load_tables() -> EngineTables:
+    """Build the shared engine tables on first call and return the cached instance.
+
+    Call this before forking (e.g. from ``create_app`` under ``--preload``) so
+    workers inherit the tables instead of building their own copy.
+    """
+    start = time.perf_counter()
+    tables = EngineTables(
+        piece_square=memoryview(_build_piece_square()).toreadonly(),
+        zobrist_hasher=chess.polyglot.ZobristHasher(chess.polyglot.POLYGLOT_RANDOM_ARRAY),
+        opening_first_moves_white=(
+            "e2e4", "d2d4", "c2c4", "g1f3", "b1c3", "g2g3", "b2b3", "f2f4", "e2e3", "d2d3",
+        ),
+        opening_first_moves_black=(
+            "e7e5", "c7c5", "e7e6", "c7c6", "g8f6", "d7d6", "g7g6", "b8c6", "d7d5",
+        ),
+        build_seconds=time.perf_counter() - start,
+    )
+    return tables
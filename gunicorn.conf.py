@@ -0,0 +1,81 @@
+"""Gunicorn settings for the web app.
+
+The app is preloaded in the master so that the engine tables (see
+``engine/tables.py``) are built once and shared copy-on-write by all workers.
+Startup time and per-worker RSS are logged so the effect can be measured.
+
+Command-line flags (as used in the Procfile) still override these values.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import time
+from typing import Dict
+
+_CONFIG_LOADED_AT = time.perf_counter()
+
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+worker_class = "gthread"
+timeout = 120
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+# Set GUNICORN_PRELOAD=0 to compare against per-worker app loading
+preload_app = os.environ.get("GUNICORN_PRELOAD", "1") != "0"
+
+
+def _memory_kb() -> Dict[str, int]:
+    """Current RSS split into shared/private pages (Linux), in kB.
+
+    Falls back to peak RSS from ``resource`` where /proc is not available.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as fh:
+            fields = {}
+            for line in fh:
+                parts = line.split()
+                if len(parts) >= 2 and parts[1].isdigit():
+                    fields[parts[0].rstrip(":")] = int(parts[1])
+        return {
+            "rss": fields.get("Rss", 0),
+            "shared": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+            "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+        }
+    except OSError:
+        import resource
+        import sys
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, kB elsewhere
+        return {"rss": peak // 1024 if sys.platform == "darwin" else peak}
+
+
+def _format_memory(mem: Dict[str, int]) -> str:
+    return " ".join(f"{key}={value / 1024:.1f}MiB" for key, value in mem.items())
+
+
+def when_ready(server) -> None:
+    # Move everything built during preload into the permanent generation so the
+    # cyclic GC in workers never writes to (and un-shares) those pages.
+    gc.freeze()
+    server.log.info(
+        "Master ready in %.3fs (preload=%s) %s",
+        time.perf_counter() - _CONFIG_LOADED_AT,
+        server.cfg.preload_app,
+        _format_memory(_memory_kb()),
+    )
+
+
+def post_fork(server, worker) -> None:
+    worker._boot_started_at = time.perf_counter()
+
+
+def post_worker_init(worker) -> None:
+    started = getattr(worker, "_boot_started_at", None)
+    boot = time.perf_counter() - started if started is not None else float("nan")
+    worker.log.info(
+        "Worker %s booted in %.3fs %s",
+        worker.pid,
+        boot,
+        _format_memory(_memory_kb()),
+    )
@@ -0,0 +1,357 @@
+"""Concurrent load generator for the Flask API.
+
+Plays many scripted games at once against ``/api/new`` and ``/api/move`` and
+reports latency percentiles, throughput, error rates and the AI search depth
+reached, grouped by endpoint and requested depth.
+
+Targets:
+- ``--in-process``: drive ``create_app()`` through the Flask test client
+- ``--spawn``: start gunicorn locally with the Procfile settings, then load it
+- ``--url``: load an already running server
+
+Example:
+    python load_test.py --spawn --players 8 --games 2 --depths 2 3 4 --report report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# post(path, payload) -> (status_code, json_body_or_None)
+Transport = Callable[[str, dict], Tuple[int, Optional[dict]]]
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    depth: int
+    status: int
+    latency_s: float
+    ai_depth: Optional[int] = None
+    ai_book: bool = False
+    error: Optional[str] = None
+
+
+def http_transport(base_url: str, timeout_s: float = 130.0) -> Transport:
+    base_url = base_url.rstrip("/")
+
+    def post(path: str, payload: dict) -> Tuple[int, Optional[dict]]:
+        req = urllib.request.Request(
+            base_url + path,
+            data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+                return resp.status, json.loads(resp.read() or b"null")
+        except urllib.error.HTTPError as exc:
+            try:
+                body = json.loads(exc.read() or b"null")
+            except ValueError:
+                body = None
+            return exc.code, body
+
+    return post
+
+
+def flask_transport(app) -> Callable[[], Transport]:
+    """Return a factory producing one test client per player thread."""
+
+    def make() -> Transport:
+        client = app.test_client()
+
+        def post(path: str, payload: dict) -> Tuple[int, Optional[dict]]:
+            resp = client.post(path, json=payload)
+            return resp.status_code, resp.get_json(silent=True)
+
+        return post
+
+    return make
+
+
+def play_games(
+    post: Transport,
+    depth: int,
+    games: int,
+    max_moves: int,
+    seed: int,
+    record: Callable[[Sample], None],
+) -> None:
+    """Play ``games`` scripted games, choosing random legal moves with a fixed seed."""
+    rng = random.Random(seed)
+    for _ in range(games):
+        color = rng.choice(("white", "black"))
+        payload: dict = {"color": color, "depth": depth}
+        endpoint = "/api/new"
+        for _ in range(max_moves + 1):
+            start = time.perf_counter()
+            try:
+                status, body = post(endpoint, payload)
+                error = None
+            except Exception as exc:  # noqa: BLE001
+                status, body, error = 0, None, f"{type(exc).__name__}: {exc}"
+            latency = time.perf_counter() - start
+
+            if status != 200 and error is None:
+                error = (body or {}).get("error") or f"HTTP {status}"
+            record(Sample(
+                endpoint=endpoint,
+                depth=depth,
+                status=status,
+                latency_s=latency,
+                ai_depth=(body or {}).get("ai_depth") if status == 200 else None,
+                ai_book=bool((body or {}).get("ai_book")) if status == 200 else False,
+                error=error,
+            ))
+            # Abandon the game on errors; the server state is no longer ours
+            if error is not None or body is None or body.get("game_over"):
+                break
+            legal = body.get("legal_moves") or []
+            if not legal:
+                break
+            endpoint = "/api/move"
+            payload = {"move": rng.choice(legal), "depth": depth}
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile; ``nan`` for an empty sequence."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(samples: List[Sample], wall_by_depth: Dict[int, float]) -> Dict[str, object]:
+    """Aggregate samples per (endpoint, depth) for latency and per depth for throughput.
+
+    Each depth runs as one phase mixing both endpoints, so throughput is only
+    reported per depth phase (``by_depth``) and overall, never per endpoint.
+    Latency percentiles and ``ok_throughput_rps`` only count successful
+    requests; errors usually return instantly and would flatter both.
+    """
+    wall_s = sum(wall_by_depth.values())
+    groups: Dict[Tuple[str, int], List[Sample]] = {}
+    for s in samples:
+        groups.setdefault((s.endpoint, s.depth), []).append(s)
+
+    rows = []
+    for (endpoint, depth), group in sorted(groups.items()):
+        ok_latencies = [s.latency_s for s in group if s.error is None]
+        ai_depths = [s.ai_depth for s in group if s.ai_depth is not None]
+        errors = sum(1 for s in group if s.error is not None)
+        rows.append({
+            "endpoint": endpoint,
+            "depth": depth,
+            "requests": len(group),
+            "errors": errors,
+            "error_rate": errors / len(group),
+            "p50_ms": percentile(ok_latencies, 50) * 1000,
+            "p95_ms": percentile(ok_latencies, 95) * 1000,
+            "p99_ms": percentile(ok_latencies, 99) * 1000,
+            "max_ms": max(ok_latencies, default=float("nan")) * 1000,
+            "ai_depth_mean": sum(ai_depths) / len(ai_depths) if ai_depths else None,
+            "ai_depth_min": min(ai_depths, default=None),
+            "ai_depth_max": max(ai_depths, default=None),
+            # Opening-variety picks; excluded from the ai_depth stats
+            "ai_book_moves": sum(1 for s in group if s.ai_book),
+        })
+
+    by_depth = []
+    for depth, wall in sorted(wall_by_depth.items()):
+        in_phase = [s for s in samples if s.depth == depth]
+        ok = sum(1 for s in in_phase if s.error is None)
+        by_depth.append({
+            "depth": depth,
+            "wall_seconds": wall,
+            "requests": len(in_phase),
+            "errors": len(in_phase) - ok,
+            "throughput_rps": len(in_phase) / wall if wall > 0 else 0.0,
+            "ok_throughput_rps": ok / wall if wall > 0 else 0.0,
+        })
+
+    error_counts: Dict[str, int] = {}
+    for s in samples:
+        if s.error is not None:
+            error_counts[s.error] = error_counts.get(s.error, 0) + 1
+
+    errors = sum(error_counts.values())
+    return {
+        "wall_seconds": wall_s,
+        "requests": len(samples),
+        "errors": errors,
+        "throughput_rps": len(samples) / wall_s if wall_s > 0 else 0.0,
+        "ok_throughput_rps": (len(samples) - errors) / wall_s if wall_s > 0 else 0.0,
+        "by_depth": by_depth,
+        "by_endpoint_depth": rows,
+        "error_messages": dict(sorted(error_counts.items(), key=lambda kv: -kv[1])[:10]),
+    }
+
+
+def run_load(
+    transport_factory: Callable[[], Transport],
+    depths: Sequence[int],
+    players: int,
+    games: int,
+    max_moves: int,
+    seed: int = 0,
+) -> Dict[str, object]:
+    """Run ``players`` concurrent players per depth, one depth after another."""
+    samples: List[Sample] = []
+    lock = threading.Lock()
+
+    def record(sample: Sample) -> None:
+        with lock:
+            samples.append(sample)
+
+    wall_by_depth: Dict[int, float] = {}
+    for depth in depths:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=players) as pool:
+            futures = [
+                pool.submit(play_games, transport_factory(), depth, games, max_moves, seed + i, record)
+                for i in range(players)
+            ]
+            for fut in futures:
+                fut.result()
+        wall_by_depth[depth] = wall_by_depth.get(depth, 0.0) + time.perf_counter() - start
+
+    report = summarize(samples, wall_by_depth)
+    report["config"] = {
+        "depths": list(depths),
+        "players": players,
+        "games": games,
+        "max_moves": max_moves,
+        "seed": seed,
+    }
+    report["samples"] = [asdict(s) for s in samples]
+    return report
+
+
+def _wait_until_up(base_url: str, proc: subprocess.Popen, timeout_s: float = 30.0) -> None:
+    deadline = time.time() + timeout_s
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"gunicorn exited early with code {proc.returncode}")
+        try:
+            with urllib.request.urlopen(base_url + "/", timeout=1.0):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not come up within {timeout_s}s")
+
+
+def spawn_gunicorn(port: int, workers: int, threads: int) -> subprocess.Popen:
+    """Start gunicorn with the Procfile settings bound to localhost."""
+    cmd = [
+        sys.executable, "-m", "gunicorn",
+        "-c", "gunicorn.conf.py",
+        "-w", str(workers),
+        "-k", "gthread",
+        "--threads", str(threads),
+        "-t", "120",
+        "-b", f"127.0.0.1:{port}",
+        "web:app",
+    ]
+    return subprocess.Popen(cmd, cwd=PROJECT_ROOT, env=dict(os.environ, PORT=str(port)))
+
+
+def format_report(report: Dict[str, object]) -> str:
+    header = (
+        f"{'endpoint':<10} {'depth':>5} {'reqs':>6} {'err%':>6} "
+        f"{'p50ms':>8} {'p95ms':>8} {'p99ms':>8} {'aiDepth':>8} {'book':>5}"
+    )
+    lines = [header, "-" * len(header)]
+    for row in report["by_endpoint_depth"]:
+        ai_depth = row["ai_depth_mean"]
+        lines.append(
+            f"{row['endpoint']:<10} {row['depth']:>5} {row['requests']:>6} "
+            f"{row['error_rate'] * 100:>5.1f}% "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} "
+            f"{'-' if ai_depth is None else f'{ai_depth:.2f}':>8} {row['ai_book_moves']:>5}"
+        )
+    for phase in report["by_depth"]:
+        lines.append(
+            f"depth {phase['depth']}: {phase['requests']} requests, "
+            f"{phase['throughput_rps']:.2f} req/s ({phase['ok_throughput_rps']:.2f} ok) "
+            f"over {phase['wall_seconds']:.1f}s"
+        )
+    lines.append(
+        f"total: {report['requests']} requests, {report['errors']} errors, "
+        f"{report['throughput_rps']:.2f} req/s ({report['ok_throughput_rps']:.2f} ok) "
+        f"over {report['wall_seconds']:.1f}s"
+    )
+    for message, count in report["error_messages"].items():
+        lines.append(f"  {count:>5}x {message}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Base URL of a running server")
+    target.add_argument("--spawn", action="store_true", help="Start gunicorn locally")
+    target.add_argument("--in-process", action="store_true", help="Use the Flask test client")
+    parser.add_argument("--players", type=int, default=4, help="Concurrent players per depth")
+    parser.add_argument("--games", type=int, default=1, help="Games per player")
+    parser.add_argument("--moves", type=int, default=10, help="Max player moves per game")
+    parser.add_argument("--depths", type=int, nargs="+", default=[2, 3, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--port", type=int, default=5055, help="Port for --spawn")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn workers for --spawn")
+    parser.add_argument("--threads", type=int, default=1, help="gthread threads for --spawn")
+    parser.add_argument("--report", help="Write the JSON report to this path")
+    parser.add_argument("--samples", action="store_true", help="Include raw samples in the JSON report")
+    args = parser.parse_args(argv)
+
+    proc: Optional[subprocess.Popen] = None
+    if args.in_process:
+        from web import create_app
+
+        app = create_app()
+        # Failures are counted in the report; skip per-request tracebacks
+        app.logger.disabled = True
+        factory = flask_transport(app)
+    else:
+        base_url = args.url
+        if args.spawn:
+            base_url = f"http://127.0.0.1:{args.port}"
+            proc = spawn_gunicorn(args.port, args.workers, args.threads)
+        factory = lambda: http_transport(base_url)  # noqa: E731
+
+    try:
+        if proc is not None:
+            _wait_until_up(base_url, proc)
+        report = run_load(factory, args.depths, args.players, args.games, args.moves, args.seed)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=30)
+
+    if args.spawn:
+        report["config"]["server"] = {"workers": args.workers, "threads": args.threads}
+    print(format_report(report))
+    if args.report:
+        if not args.samples:
+            report.pop("samples", None)
+        Path(args.report).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -24,9 +24,15 @@ def test_api_depth6_returns_ai_move():
     client = app.test_client()
     r = client.post("/api/new", json={})
     assert r.status_code == 200
+    # The first reply comes from the opening-variety list; play past it so
+    # the depth-6 request actually searches
     r = client.post("/api/move", json={"move": "e2e4", "depth": 6})
     assert r.status_code == 200
+    assert r.get_json()["ai_book"] is True
+    r = client.post("/api/move", json={"move": "g1f3", "depth": 6})
+    assert r.status_code == 200
     data = r.get_json()
     assert "ai_move" in data and data["ai_move"]
+    assert data["ai_book"] is False and data["ai_depth"] >= 1
 
 
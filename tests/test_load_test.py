@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from load_test import Sample, flask_transport, percentile, run_load, summarize
+from web import create_app
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 99) == 3.0
+
+
+def test_summarize_groups_by_endpoint_and_depth():
+    samples = [
+        Sample("/api/new", 2, 200, 0.01, ai_depth=None, ai_book=True),
+        Sample("/api/move", 2, 200, 0.20, ai_depth=2),
+        Sample("/api/move", 2, 400, 0.01, error="Illegal move: e2e4"),
+    ]
+    report = summarize(samples, {2: 1.0})
+    move = next(r for r in report["by_endpoint_depth"] if r["endpoint"] == "/api/move")
+    assert move["requests"] == 2 and move["errors"] == 1
+    assert move["error_rate"] == 0.5
+    assert move["p50_ms"] == 200.0
+    assert move["ai_depth_mean"] == 2
+    assert "throughput_rps" not in move
+    assert report["by_depth"] == [{
+        "depth": 2, "wall_seconds": 1.0, "requests": 3, "errors": 1,
+        "throughput_rps": 3.0, "ok_throughput_rps": 2.0,
+    }]
+    new = next(r for r in report["by_endpoint_depth"] if r["endpoint"] == "/api/new")
+    assert new["ai_depth_mean"] is None and new["ai_book_moves"] == 1
+    assert report["error_messages"] == {"Illegal move: e2e4": 1}
+
+
+def test_single_player_in_process_run_has_no_errors():
+    report = run_load(flask_transport(create_app()), depths=[1], players=1, games=1, max_moves=3)
+    assert report["requests"] >= 2
+    assert report["errors"] == 0
+    assert any(s["ai_depth"] for s in report["samples"] if s["endpoint"] == "/api/move")
+
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import chess
+import chess.polyglot
+
+from engine import AIPlayer, Evaluator, load_tables
+from engine.tables import piece_square_offset
+
+
+def _reference_material_pst(board: chess.Board) -> int:
+    score = 0
+    for piece_type in chess.PIECE_TYPES:
+        pst = Evaluator._pst_for(piece_type)
+        for square in board.pieces(piece_type, chess.WHITE):
+            score += Evaluator.MATERIAL_VALUES[piece_type] + pst[square]
+        for square in board.pieces(piece_type, chess.BLACK):
+            score -= Evaluator.MATERIAL_VALUES[piece_type] + pst[chess.square_mirror(square)]
+    return score
+
+
+def test_tables_are_built_once_into_flat_buffers():
+    tables = load_tables()
+    assert load_tables() is tables
+    assert isinstance(tables.piece_square, memoryview) and len(tables.piece_square) == 768
+    assert tables.piece_square.readonly
+    assert AIPlayer()._opening_first_moves_white is tables.opening_first_moves_white
+
+
+def test_merged_piece_square_table_matches_source_tables():
+    table = load_tables().piece_square
+    assert table[piece_square_offset(chess.KNIGHT, chess.WHITE) + chess.E4] == 320 + 20
+    assert table[piece_square_offset(chess.KNIGHT, chess.BLACK) + chess.E5] == -(320 + 20)
+
+    board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4")
+    mobility = 2 * board.legal_moves.count()
+    board.push(chess.Move.null())
+    mobility -= 2 * board.legal_moves.count()
+    board.pop()
+    assert Evaluator.evaluate(board) == _reference_material_pst(board) + mobility
+
+
+def test_zobrist_hasher_matches_polyglot():
+    board = chess.Board()
+    board.push_uci("e2e4")
+    assert load_tables().zobrist_hasher(board) == chess.polyglot.zobrist_hash(board)
+
+
+def test_engine_package_imports_lazily():
+    code = "import sys, engine; print('engine.ai' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert out.stdout.strip() == "False"
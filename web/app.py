@@ -10,12 +10,17 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from engine import Game, AIPlayer
+from engine import Game, AIPlayer, load_tables
 
 
 def create_app() -> Flask:
     app = Flask(__name__, static_folder="static", template_folder="templates")
 
+    # Build shared read-only engine data up front. Under gunicorn --preload this
+    # runs once in the master and forked workers share the buffers.
+    tables = load_tables()
+    app.config["ENGINE_TABLES_BUILD_SECONDS"] = tables.build_seconds
+
     game = Game()
     ai = AIPlayer()
 
@@ -49,13 +54,15 @@ def create_app() -> Flask:
             time_budget = 1.2
 
         ai_move_uci = None
+        ai_choice = None
         pre_fen: str | None = None
         # If player chose black, AI (white) makes the first move immediately
         if color == "black" and not game.is_game_over():
             board: chess.Board = game.board
             # Capture starting position to allow frontend to animate the first AI move
             pre_fen = game.get_full_fen()
-            ai_move_uci = ai.choose_move(board, depth, time_limit_s=time_budget)
+            ai_choice = ai.search(board, depth, time_limit_s=time_budget)
+            ai_move_uci = ai_choice.move
             if ai_move_uci:
                 try:
                     game.push_uci(ai_move_uci)
@@ -65,6 +72,8 @@ def create_app() -> Flask:
 
         snap = game.snapshot()
         snap["ai_move"] = ai_move_uci
+        snap["ai_depth"] = ai_choice.depth if ai_move_uci else None
+        snap["ai_book"] = bool(ai_move_uci and ai_choice.book)
         if pre_fen is not None:
             snap["pre_fen"] = pre_fen
         return jsonify(snap)
@@ -92,16 +101,21 @@ def create_app() -> Flask:
         if game.is_game_over():
             snap = game.snapshot()
             snap["ai_move"] = None
+            snap["ai_depth"] = None
+            snap["ai_book"] = False
             return jsonify(snap)
 
         # AI move
         board: chess.Board = game.board
-        ai_move_uci = ai.choose_move(board, depth, time_limit_s=time_budget)
+        ai_choice = ai.search(board, depth, time_limit_s=time_budget)
+        ai_move_uci = ai_choice.move
         if ai_move_uci:
             game.push_uci(ai_move_uci)
 
         snap = game.snapshot()
         snap["ai_move"] = ai_move_uci
+        snap["ai_depth"] = ai_choice.depth if ai_move_uci else None
+        snap["ai_book"] = bool(ai_move_uci and ai_choice.book)
         return jsonify(snap)
 
     return app